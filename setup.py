@@ -6,8 +6,7 @@ install_requires = [
     'attrs',
     'click >=7.0,<8.0',
     'fabric <=2.5.0',
-    'paramiko',
-    'patchwork'
+    'paramiko'
 ]
 
 
@@ -1,10 +1,25 @@
 """ Common variables and functions. """
 
+import errno
+import os
 import pathlib
+import shutil
+import typing
 
 from srt_utils.exceptions import SrtUtilsException
 
 
+# Errors meaning that the kernel copy is not supported for the files, so
+# that the file should be copied another way
+_KERNEL_COPY_ERRNOS = (
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+)
+
+
 def create_local_directory(dirpath: pathlib.Path):
     """
     Helper function used to create a directory locally.
@@ -12,17 +27,171 @@ def create_local_directory(dirpath: pathlib.Path):
     Attributes:
         dirpath:
             `pathlib.Path` directory path.
-    """
-    if dirpath.exists():
-        return False
 
-    # TODO: Debug and improve this in order to catch particular exceptions
+    Returns:
+        True if the directory has been created, False if it already exists.
+
+    Raises:
+        SrtUtilsException
+    """
+    # A single mkdir call is done instead of checking whether the directory
+    # exists first. This also avoids the race between the check and the
+    # creation when several runners create the same directory concurrently
     try:
         dirpath.mkdir(parents=True)
-    except Exception as error:
+    except FileExistsError:
+        if not dirpath.is_dir():
+            raise SrtUtilsException(
+                f'Directory was not created: {dirpath}. A file with the '
+                'same name already exists'
+            )
+        return False
+    except OSError as error:
         raise SrtUtilsException(
             f'Directory was not created: {dirpath}. Exception '
             f'occured ({error.__class__.__name__}): {error}'
         )
 
-    return True
\ No newline at end of file
+    return True
+
+
+def copy_file(source: pathlib.Path, destination: pathlib.Path):
+    """
+    Helper function used to copy a file locally.
+
+    The file is copied inside the kernel via `os.copy_file_range` where
+    available (Linux, Python 3.8+), so that the data is not read into Python
+    memory. If it is not supported for the files, e.g., they are on
+    different file systems with an older kernel, `os.sendfile` is tried
+    (Linux 2.6.33+), which still copies the data inside the kernel. If
+    none of them is supported, the file is copied by chunks with
+    `shutil.copyfileobj`. Where `os.posix_fadvise` is available, the kernel
+    is advised that the source is read sequentially and that both files
+    are not needed in the page cache once copied.
+
+    Attributes:
+        source:
+            `pathlib.Path` source file path.
+        destination:
+            `pathlib.Path` destination file path.
+
+    Raises:
+        FileNotFoundError:
+            If the source file does not exist. The destination file is not
+            created in this case.
+        FileExistsError:
+            If the destination file already exists.
+        OSError
+    """
+    with source.open(mode='rb') as fsrc:
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+
+        with open(fd, mode='wb') as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(
+                    fsrc.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL
+                )
+
+            _copy_fileobj(fsrc, fdst, size)
+
+            # The files are not read again by the script, so there is no
+            # need to keep them in the page cache, e.g., evicting the
+            # statistics files being written by the running objects
+            if hasattr(os, 'posix_fadvise'):
+                fdst.flush()
+                os.posix_fadvise(fsrc.fileno(), 0, size, os.POSIX_FADV_DONTNEED)
+                os.posix_fadvise(fdst.fileno(), 0, size, os.POSIX_FADV_DONTNEED)
+
+
+def _copy_fileobj(
+    fsrc: typing.BinaryIO,
+    fdst: typing.BinaryIO,
+    size: int
+):
+    """
+    Copy `size` bytes from `fsrc` file into `fdst` file opened in binary
+    mode, trying the kernel copy first, see `copy_file`.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            _copy_file_range(fsrc.fileno(), fdst.fileno(), size)
+            return
+        except OSError as error:
+            if error.errno not in _KERNEL_COPY_ERRNOS:
+                raise
+
+    if hasattr(os, 'sendfile'):
+        try:
+            _sendfile(fsrc.fileno(), fdst.fileno(), size)
+            return
+        except OSError as error:
+            if error.errno not in _KERNEL_COPY_ERRNOS:
+                raise
+            # sendfile writes at the current destination position
+            fdst.seek(0)
+
+    # Source file position is not changed by copying with offsets above
+    shutil.copyfileobj(fsrc, fdst)
+
+
+def link_file(source: pathlib.Path, destination: pathlib.Path):
+    """
+    Helper function used to create a hard link to a file locally, so that
+    no data is copied. If the hard link can not be created, e.g., the source
+    and destination are on different file systems, the file is copied via
+    `copy_file`.
+
+    Attributes:
+        source:
+            `pathlib.Path` source file path.
+        destination:
+            `pathlib.Path` destination file path.
+
+    Raises:
+        FileNotFoundError:
+            If the source file does not exist.
+        FileExistsError:
+            If the destination file already exists.
+        OSError
+    """
+    try:
+        os.link(source, destination)
+    except OSError as error:
+        if error.errno not in (
+            errno.EXDEV,
+            errno.EPERM,
+            errno.EMLINK,
+            errno.EOPNOTSUPP,
+        ):
+            raise
+        copy_file(source, destination)
+
+
+def _copy_file_range(fd_src: int, fd_dst: int, size: int):
+    """
+    Copy `size` bytes from the beginning of `fd_src` file into `fd_dst`
+    file via `os.copy_file_range` without changing file positions.
+    """
+    offset = 0
+
+    while offset < size:
+        copied = os.copy_file_range(fd_src, fd_dst, size - offset, offset, offset)
+        if copied == 0:
+            break
+        offset += copied
+
+
+def _sendfile(fd_src: int, fd_dst: int, size: int):
+    """
+    Copy `size` bytes from the beginning of `fd_src` file into `fd_dst`
+    file via `os.sendfile` without changing `fd_src` file position.
+    """
+    offset = 0
+
+    while offset < size:
+        copied = os.sendfile(fd_dst, fd_src, offset, size - offset)
+        if copied == 0:
+            break
+        offset += copied
@@ -1,23 +1,37 @@
 """ The module with IObjectRunner interface and its implementations. """
+import atexit
+import concurrent.futures
+import functools
 import logging
+import os
 import pathlib
+import shlex
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import threading
+import typing
+import uuid
 from abc import abstractmethod, ABC
 
 import fabric
 import paramiko
-from patchwork.files import exists
 
-from srt_utils.common import create_local_directory
+from srt_utils.common import copy_file, create_local_directory, link_file
 from srt_utils.enums import Status
 from srt_utils.exceptions import SrtUtilsException
 from srt_utils.objects import IObject
 from srt_utils.process import Process
+from srt_utils.ssh_pool import get_connection
 
 
 logger = logging.getLogger(__name__)
 
 
 SSH_CONNECTION_TIMEOUT = 10
+SSH_SERVER_ALIVE_INTERVAL = 10
+SSH_SERVER_ALIVE_COUNT_MAX = 6
 # NOTE: It is important to add "-tt" option in order for subprocess to be
 # able to pass SIGINT, SIGTERM signals to the command running remotely.
 # Before "-t" option was used, experiments showed that "-t" option does not
@@ -30,12 +44,151 @@ SSH_CONNECTION_TIMEOUT = 10
 # NOTE: It is important to add # "-o ConnectTimeout={SSH_CONNECTION_TIMEOUT}"
 # option in case when the server is down not to wait and be able to check 
 # quickly that the process has not been started successfully
-SSH_COMMON_ARGS = [
-    'ssh', 
-    '-tt',
+# NOTE: "-o ControlMaster=auto", "-o ControlPath" and "-o ControlPersist"
+# options enable OpenSSH connection multiplexing. The first ssh invocation
+# for a particular username@host opens a master connection, subsequent
+# invocations reuse it via a UNIX socket without doing TCP + SSH handshake
+# and authentication again. The process id is a part of the socket path, so
+# that the scripts running at the same time do not share master connections.
+# Master connections are closed at exit by `close_ssh_masters`. This applies
+# to ssh processes only, fabric (paramiko) connections are not multiplexed
+# this way, they are reused via the pool of connections instead. The control
+# sockets are kept in a separate directory, so that ~/.ssh is not cluttered.
+# The directory is created by `register_ssh_destination` before ssh is
+# launched, it must exist: ssh fails if the control socket can not be
+# created there. ControlPersist requires OpenSSH 5.6 or newer
+# NOTE: "-o ServerAliveInterval" and "-o ServerAliveCountMax" options make
+# ssh detect a dead connection, e.g., when the remote machine goes down
+# while collecting the artifacts, instead of hanging until TCP gives up.
+# The limit (one minute by default) is generous on purpose, since the
+# master connection is shared with the objects running remotely and a
+# short outage of the control network should not stop them
+SSH_CONTROL_DIR = pathlib.Path('~/.srt-utils').expanduser()
+SSH_CONTROL_PATH = f'{SSH_CONTROL_DIR}/cm-%r@%h:%p-{os.getpid()}'
+# NOTE: The arguments are stored as tuples in order to prevent them from
+# being modified accidentally by the code building commands on top of them
+SSH_OPTIONS = (
     '-o', 'BatchMode=yes',
     '-o', f'ConnectTimeout={SSH_CONNECTION_TIMEOUT}',
-]
+    '-o', f'ServerAliveInterval={SSH_SERVER_ALIVE_INTERVAL}',
+    '-o', f'ServerAliveCountMax={SSH_SERVER_ALIVE_COUNT_MAX}',
+    '-o', 'ControlMaster=auto',
+    '-o', f'ControlPath={SSH_CONTROL_PATH}',
+    '-o', 'ControlPersist=60s',
+)
+SSH_COMMON_ARGS = (
+    'ssh', 
+    '-tt',
+    *SSH_OPTIONS,
+)
+# NOTE: Pseudo-terminal must not be allocated when transferring files
+# through ssh stdout, otherwise the binary stream gets corrupted by 
+# the terminal line discipline, e.g., \n is replaced with \r\n. These
+# arguments are also used to run the objects without pseudo-terminal, see
+# `use_pty` attribute of `RemoteRunner`
+SSH_NO_PTY_ARGS = (
+    'ssh',
+    '-T',
+    *SSH_OPTIONS,
+)
+# Transports available for downloading object artifacts from a remote machine
+# by `RemoteRunner`: 'sftp' - via fabric (paramiko) SFTP client over the pooled
+# connection, 'scp' - via scp application reusing ssh master connection,
+# 'rsync' - via rsync application reusing ssh master connection, the file is
+# written into a temporary file and renamed once transferred, so that an
+# interrupted transfer does not leave a truncated file behind,
+# 'auto' - scp for the files bigger than SCP_MIN_FILE_SIZE if scp is available,
+# sftp otherwise. SFTP works well for small files, while scp streams the file
+# without waiting for per-request acknowledgements which is faster for the 
+# big ones, e.g., .pcapng trace files. If scp or rsync is not available on
+# the local machine, or the file path contains spaces or shell metacharacters
+# in case of scp, the file is downloaded via sftp. When the results are
+# collected via `RemoteRunner.collect_results_bulk`, the artifacts of the
+# runners with 'auto' transport from the same machine are transferred as
+# a single tar stream instead
+TRANSPORTS = ('auto', 'sftp', 'scp', 'rsync')
+SCP_MIN_FILE_SIZE = 16 * 1024 * 1024
+# Modes available for collecting object artifacts by `LocalRunner`: 'copy' -
+# the files are copied, 'link' - hard links to the files are created if the
+# source and destination are on the same file system, the files are copied
+# otherwise. A hard link shares the data with the source file, so changing
+# the source after collecting the results changes the collected file too
+COLLECT_MODES = ('copy', 'link')
+# Size of the chunks the rest of tar stream is read in once the archive
+# has been unpacked
+TAR_READ_SIZE = 64 * 1024
+# The list of username@host destinations ssh master connections might have
+# been opened to
+_SSH_DESTINATIONS = set()
+
+# Directories already created by the runners, so that the same directory
+# is not created again by the other runners, (username, host, dirpath)
+# tuples for remote machines and `pathlib.Path` paths for a local one.
+# The directories are remembered within one experiment only, see
+# `forget_created_directories`, since they might be removed in between
+_CREATED_REMOTE_DIRS = set()
+_CREATED_LOCAL_DIRS = set()
+_CREATED_DIRS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def get_ssh_args(username: str, host: str, use_pty: bool=True):
+    """
+    Helper function used to get ssh arguments for running a command on
+    a remote machine, the command itself should be appended to them.
+    The arguments are built once per (username, host, use_pty) and shared
+    by all the runners.
+
+    Attributes:
+        username:
+            Username on the remote machine to connect through.
+        host:
+            IP address of the remote machine to connect.
+        use_pty:
+            True/False depending on whether pseudo-terminal should be
+            allocated for the command.
+
+    Returns:
+        A tuple of ssh arguments.
+    """
+    common_args = SSH_COMMON_ARGS if use_pty else SSH_NO_PTY_ARGS
+    return (*common_args, f'{username}@{host}')
+
+
+def register_ssh_destination(username: str, host: str):
+    """
+    Helper function used to register username@host destination the ssh
+    master connection is going to be opened to, so that the connection is
+    closed at exit. The directory for control sockets is created if needed.
+
+    Attributes:
+        username:
+            Username on the remote machine to connect through.
+        host:
+            IP address of the remote machine to connect.
+    """
+    SSH_CONTROL_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _SSH_DESTINATIONS.add(f'{username}@{host}')
+
+
+@atexit.register
+def close_ssh_masters():
+    """
+    Helper function used to close ssh master connections opened by the
+    script via `ssh -O exit`.
+    """
+    for destination in _SSH_DESTINATIONS:
+        subprocess.run(
+            [
+                'ssh',
+                '-o', f'ControlPath={SSH_CONTROL_PATH}',
+                '-O', 'exit',
+                destination,
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    _SSH_DESTINATIONS.clear()
 
 
 def before_collect_results_checks(
@@ -59,16 +212,106 @@ def before_collect_results_checks(
             'Can not collect artifacts'
         )
 
+    # There is nothing to save in the directory if the object does not
+    # produce any artifacts
+    if not obj.artifacts:
+        return
+
     # It's expected that at this moment directory 
     # self.collect_results_path already exists, because it is created 
     # in SingleExperimentRunner class
-    if not collect_results_path.exists():
+    if not os.path.exists(collect_results_path):
         raise SrtUtilsException(
             'There was no directory for collecting experiment results created: '
             f'{collect_results_path}. Can not collect artifacts'
         )
 
 
+def get_output_paths(
+    obj: IObject,
+    collect_results_path: pathlib.Path,
+    logs_prefix: typing.Optional[str]
+):
+    """
+    Helper function which returns the file paths process stdout and stderr
+    of the object should be written to, `logs` directory inside 
+    `collect_results_path` directory. The paths are not defined if
+    `logs_prefix` is not specified, in this case the output is kept in
+    memory until the results are collected.
+
+    Returns:
+        A tuple of stdout and stderr `pathlib.Path` file paths or
+        (None, None).
+    """
+    if logs_prefix is None:
+        return (None, None)
+
+    logs_dir = collect_results_path / 'logs'
+    return (
+        logs_dir / f'{logs_prefix}-{obj}.stdout.log',
+        logs_dir / f'{logs_prefix}-{obj}.stderr.log',
+    )
+
+
+def ensure_local_directory(dirpath: pathlib.Path):
+    """
+    Helper function used to create a local directory needed by the object
+    before starting it. The directories already created by the runners are
+    remembered, so that no filesystem call is done when several objects
+    share the same directory.
+
+    Attributes:
+        dirpath:
+            `pathlib.Path` directory path.
+
+    Raises:
+        SrtUtilsException
+    """
+    with _CREATED_DIRS_LOCK:
+        if dirpath in _CREATED_LOCAL_DIRS:
+            return
+
+    _ = create_local_directory(dirpath)
+
+    with _CREATED_DIRS_LOCK:
+        _CREATED_LOCAL_DIRS.add(dirpath)
+
+
+def forget_created_directories():
+    """
+    Helper function used to forget the directories created by the runners,
+    so that they are created again if needed. Called once an experiment
+    is started or cleaned up, since the directories might have been removed
+    since the previous experiment, e.g. by the user.
+    """
+    with _CREATED_DIRS_LOCK:
+        _CREATED_LOCAL_DIRS.clear()
+        _CREATED_REMOTE_DIRS.clear()
+
+
+def log_missing_artifact(
+    obj: IObject,
+    process: Process,
+    filepath: pathlib.Path
+):
+    """
+    Helper function which logs a warning about the artifact that was not
+    created by the object together with the process stdout and stderr.
+
+    The stdout and stderr can be big, that's why they are read and
+    formatted only if the warning is going to be logged.
+    """
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+
+    stdout, stderr = process.collect_results()
+    logger.warning(
+        'File %s was not created by the object: %s, nothing to collect. '
+        'Process stdout: %s. Process stderr: %s',
+        filepath, obj, stdout, stderr
+    )
+
+
 class IObjectRunner(ABC):
     """
     Object Runner interface.
@@ -81,6 +324,8 @@ class IObjectRunner(ABC):
     machine via SSH using Python library `subprocess`, etc.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def status(self) -> Status:
@@ -149,12 +394,166 @@ class IObjectRunner(ABC):
         pass
 
 
+    @classmethod
+    def start_many(cls, runners: typing.List['IObjectRunner']):
+        """
+        Start several objects in parallel, see `run_in_parallel`. The order
+        in which the objects are started is not defined, so this should be
+        used only when it does not matter, otherwise the objects should be
+        started one by one via `start`.
+
+        Attributes:
+            runners:
+                The list of object runners.
+
+        Raises:
+            SrtUtilsException
+        """
+        run_in_parallel(runners, 'start')
+
+
+    @classmethod
+    def stop_many(cls, runners: typing.List['IObjectRunner']):
+        """
+        Stop several objects in parallel, see `run_in_parallel`. The order
+        in which the objects are stopped is not defined, so this should be
+        used only when it does not matter, otherwise the objects should be
+        stopped one by one via `stop`.
+
+        Attributes:
+            runners:
+                The list of object runners.
+
+        Raises:
+            SrtUtilsException
+        """
+        run_in_parallel(runners, 'stop')
+
+
+    @classmethod
+    def create_directories_bulk(cls, runners: typing.List['IObjectRunner']):
+        """
+        Create the directories for saving object results for several object
+        runners of this type at once before starting the objects.
+
+        By default, nothing is done here and the directories are created by
+        each runner when starting the object. Interface implementations may
+        override this in order to create the directories of several runners
+        at once, in this case the runners do not create them again.
+
+        Attributes:
+            runners:
+                The list of object runners of this type.
+
+        Raises:
+            SrtUtilsException
+        """
+        pass
+
+
+    @classmethod
+    def collect_results_bulk(cls, runners: typing.List['IObjectRunner']):
+        """
+        Collect results of several objects run by the runners of this type.
+
+        By default, the results are collected runner by runner. Interface
+        implementations may override this in order to collect the results
+        of several runners at once. Errors are logged and do not prevent
+        collecting the results of other runners.
+
+        Attributes:
+            runners:
+                The list of object runners of this type.
+        """
+        for runner in runners:
+            try:
+                runner.collect_results()
+            except SrtUtilsException as error:
+                logger.error(
+                    'Failed to collect object results: %s. Reason: %s',
+                    runner.obj, error
+                )
+
+
+def run_in_parallel(
+    runners: typing.List[IObjectRunner],
+    method_name: str,
+    max_workers: int=8
+):
+    """
+    Helper function used to call the same method of several object runners
+    in parallel using a pool of threads, e.g., to start, stop or collect
+    the results of the objects run on different remote machines. Since the
+    work done by the runners is mostly waiting for network, the total time
+    is close to the time of the slowest runner instead of the sum.
+
+    The order in which the method is called for the runners is not defined,
+    so the function should not be used when the order matters, e.g., when
+    the receiver should be started before the sender.
+
+    Attributes:
+        runners:
+            The list of object runners.
+        method_name:
+            The name of the method to call, e.g., 'start', 'stop',
+            'collect_results'.
+        max_workers:
+            The maximum number of threads, no more threads than runners
+            are started. The number is kept small by default not to hit
+            the limit of unauthenticated connections on the SSH server
+            (`MaxStartups`, 10 by default in OpenSSH).
+
+    Returns:
+        The list of values returned by the method in the order of runners.
+
+    Raises:
+        The first exception raised by the method, if any. The method is
+        called for all the runners anyway, the exception is raised once
+        all of them have finished.
+    """
+    if not runners:
+        return []
+
+    max_workers = min(len(runners), max_workers)
+    results = [None] * len(runners)
+    first_error = None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = {
+            executor.submit(getattr(runner, method_name)): i
+            for i, runner in enumerate(runners)
+        }
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as error:
+                if first_error is None:
+                    first_error = error
+
+    if first_error is not None:
+        raise first_error
+
+    return results
+
+
 class LocalRunner(IObjectRunner):
 
+    __slots__ = (
+        'obj',
+        'collect_results_path',
+        'collect_mode',
+        'args',
+        'process',
+    )
+
     def __init__(
         self,
         obj: IObject,
-        collect_results_path: pathlib.Path=pathlib.Path('.')
+        collect_results_path: pathlib.Path=pathlib.Path('.'),
+        logs_prefix: typing.Optional[str]=None,
+        collect_mode: str='copy',
+        capture_output: bool=True
     ):
         """
         Runner used to run the object locally using Python
@@ -166,11 +565,44 @@ class LocalRunner(IObjectRunner):
             collect_results_path:
                 `pathlib.Path` directory path where the results produced by 
                 the object should be copied once the object finishes its work.
+            logs_prefix:
+                If specified, process stdout and stderr are written to
+                `{logs_prefix}-{obj}.stdout.log` and `.stderr.log` files
+                in `logs` directory inside `collect_results_path` directory
+                instead of being kept in memory.
+            collect_mode:
+                Mode used to collect object artifacts, one of `COLLECT_MODES`.
+            capture_output:
+                True/False depending on whether process stdout and stderr
+                should be kept in memory if `logs_prefix` is not specified.
+                Objects writing their results into the files, e.g. tshark,
+                can have the output discarded.
+
+        Raises:
+            SrtUtilsException
         """
+        if collect_mode not in COLLECT_MODES:
+            raise SrtUtilsException(
+                f'Unknown collect mode: {collect_mode}. Supported modes: '
+                f'{COLLECT_MODES}'
+            )
+
         self.obj = obj
         self.collect_results_path = collect_results_path
+        self.collect_mode = collect_mode
         self.args = self.obj.make_args()
-        self.process = Process(self.args)
+        stdout_path, stderr_path = get_output_paths(
+            self.obj,
+            self.collect_results_path,
+            logs_prefix
+        )
+        self.process = Process(
+            self.args,
+            False,
+            stdout_path,
+            stderr_path,
+            capture_output
+        )
 
 
     @property
@@ -191,10 +623,11 @@ class LocalRunner(IObjectRunner):
         """
         logger.info(
             '[LocalRunner] Creating local directory for saving object '
-            f'artifacts: {dirpath}'
+            'artifacts: %s',
+            dirpath
         )
 
-        _ = create_local_directory(dirpath)
+        ensure_local_directory(dirpath)
 
 
     @classmethod
@@ -202,37 +635,81 @@ class LocalRunner(IObjectRunner):
         """
         Config Example:
             config = {
-                'collect_results_path': '_results_exp'      # optional
+                'collect_results_path': '_results_exp',     # optional
+                'logs_prefix': 'task-1',                    # optional
+                'collect_mode': 'copy',                     # optional
+                'capture_output': True                      # optional
             }
         """
+        kwargs = {}
+
         if 'collect_results_path' in config:
-            return cls(obj, pathlib.Path(config['collect_results_path']))
+            kwargs['collect_results_path'] = pathlib.Path(
+                config['collect_results_path']
+            )
 
-        return cls(obj)
+        if 'logs_prefix' in config:
+            kwargs['logs_prefix'] = config['logs_prefix']
+
+        if 'collect_mode' in config:
+            kwargs['collect_mode'] = config['collect_mode']
+
+        if 'capture_output' in config:
+            kwargs['capture_output'] = config['capture_output']
+
+        return cls(obj, **kwargs)
 
 
     def start(self):
-        logger.info(f'Starting object on-premises: {self.obj}')
-        logger.info(f'Arguments for LocalRunner: {self.obj.make_args()}')
+        logger.info('Starting object on-premises: %s', self.obj)
+        logger.info('Arguments for LocalRunner: %s', self.args)
 
         for filepath in self.obj.artifacts:
             self._create_directory(filepath.parent)
 
+        if self.process.stdout_path is not None:
+            self._create_directory(self.process.stdout_path.parent)
+
         self.process.start()
 
 
     def stop(self):
-        logger.info(f'Stopping object on-premises: {self.obj}, {self.process}')
+        logger.info(
+            'Stopping object on-premises: %s, %s',
+            self.obj, self.process
+        )
         self.process.stop()
 
 
+    def wait_until_exit(self, timeout: typing.Optional[float]=None):
+        """
+        Wait for the object to finish its work without polling its status.
+
+        Attributes:
+            timeout:
+                Maximum time to wait in seconds, optional. If not specified,
+                wait until the object finishes.
+
+        Returns:
+            True if the object has finished, False if it is still running
+            after `timeout` seconds.
+
+        Raises:
+            SrtUtilsException
+        """
+        return self.process.wait(timeout) is not None
+
+
     def collect_results(self):
         """
         Before collecting object artifacts, this function creates a local 
         directory `local` inside self.collect_results_path directory
         where the results produced by the object are copied.
         """
-        logger.info(f'Collecting object artifacts: {self.obj}, {self.process}')
+        logger.info(
+            'Collecting object artifacts: %s, %s',
+            self.obj, self.process
+        )
 
         before_collect_results_checks(
             self.obj,
@@ -240,7 +717,7 @@ class LocalRunner(IObjectRunner):
             self.collect_results_path
         )
 
-        if self.obj.artifacts is []:
+        if not self.obj.artifacts:
             logger.info('There were no artifacts expected, nothing to collect')
             return
 
@@ -248,8 +725,8 @@ class LocalRunner(IObjectRunner):
         # (inside self.collect_results_path directory)
         destination_dir = self.collect_results_path / 'local'
         logger.info(
-            'Creating local directory for saving object artifacts: '
-            f'{destination_dir}'
+            'Creating local directory for saving object artifacts: %s',
+            destination_dir
         )
         _ = create_local_directory(destination_dir)
 
@@ -265,28 +742,26 @@ class LocalRunner(IObjectRunner):
         # to make sure that the file names for different tasks are unique.
 
         for filepath in self.obj.artifacts:
-            logger.info(f'Saving file: {filepath} into: {destination_dir}')
-
-            # Check if the file exists on a local machine
-            if not filepath.exists():
-                stdout, stderr = self.process.collect_results()
-                logger.warning(
-                    f'File {filepath} was not created by the object: '
-                    f'{self.obj}, nothing to collect. Process stdout: '
-                    f'{stdout}. Process stderr: {stderr}'
-                )
-                continue
+            logger.info('Saving file: %s into: %s', filepath, destination_dir)
 
             destination = destination_dir / filepath.name
 
+            # The source file is opened before the destination one is
+            # created, so there is no need to check separately whether
+            # the file exists on a local machine
             try:
-                with destination.open(mode='xb') as fid:
-                    fid.write(filepath.read_bytes())
+                if self.collect_mode == 'link':
+                    link_file(filepath, destination)
+                else:
+                    copy_file(filepath, destination)
+            except FileNotFoundError:
+                log_missing_artifact(self.obj, self.process, filepath)
             except FileExistsError:
                 logger.error(
                     'The destination file already exists, there might be a '
-                    f'file created by another object: {destination}. File '
-                    f'with object results was not copied: {filepath}'
+                    'file created by another object: %s. File with object '
+                    'results was not copied: %s',
+                    destination, filepath
                 )
 
         # TODO: (?) Delete source file, might be an option, but not necessary at the start
@@ -294,12 +769,28 @@ class LocalRunner(IObjectRunner):
 
 class RemoteRunner(IObjectRunner):
 
+    __slots__ = (
+        'obj',
+        'username',
+        'host',
+        'collect_results_path',
+        'transport',
+        'use_pty',
+        'pidfile',
+        'args',
+        'process',
+    )
+
     def __init__(
         self,
         obj: IObject,
         username: str,
         host: str,
-        collect_results_path: pathlib.Path=pathlib.Path('.')
+        collect_results_path: pathlib.Path=pathlib.Path('.'),
+        transport: str='auto',
+        logs_prefix: typing.Optional[str]=None,
+        use_pty: bool=True,
+        capture_output: bool=True
     ):
         """
         Runner used to run the object remotely via SSH using Python
@@ -315,18 +806,72 @@ class RemoteRunner(IObjectRunner):
             collect_results_path:
                 `pathlib.Path` directory path where the results produced by 
                 the object should be copied once the object finishes its work.
+            transport:
+                Transport used to download object artifacts, one of
+                `TRANSPORTS`.
+            logs_prefix:
+                If specified, stdout and stderr of ssh process are written to
+                `{logs_prefix}-{obj}.stdout.log` and `.stderr.log` files
+                in `logs` directory inside `collect_results_path` directory
+                instead of being kept in memory.
+            use_pty:
+                True/False depending on whether pseudo-terminal should be
+                allocated for the object. By default, pseudo-terminal is
+                allocated so that SIGINT sent to ssh process is passed to the
+                object. Without pseudo-terminal, the object output is not
+                passed through the terminal line discipline, and the object
+                is stopped by sending SIGINT to its process id stored in a
+                temporary file on the remote machine.
+            capture_output:
+                True/False depending on whether stdout and stderr of ssh
+                process should be kept in memory if `logs_prefix` is not
+                specified. Objects writing their results into the files,
+                e.g. tshark, can have the output discarded.
+
+        Raises:
+            SrtUtilsException
         """
+        if transport not in TRANSPORTS:
+            raise SrtUtilsException(
+                f'Unknown transport: {transport}. Supported transports: '
+                f'{TRANSPORTS}'
+            )
+
         self.obj = obj
         self.username = username
         self.host = host
         self.collect_results_path = collect_results_path
+        self.transport = transport
+        self.use_pty = use_pty
+        self.pidfile = None
         
-        self.args = []
-        self.args += SSH_COMMON_ARGS
-        self.args += [f'{self.username}@{self.host}']
-        self.args += [self.obj.make_str()]
-
-        self.process = Process(self.args, True)
+        # The command is passed to ssh as a single argument and is parsed by
+        # the shell on the remote machine, that's why each argument is quoted
+        command = self.obj.make_str()
+
+        if not self.use_pty:
+            # The shell stores its process id and is replaced by the object
+            # via exec, so the stored process id is the object one
+            self.pidfile = f'/tmp/srt-utils-{uuid.uuid4().hex}.pid'
+            command = f'echo $$ > {self.pidfile}; exec {command}'
+
+        self.args = [
+            *get_ssh_args(self.username, self.host, self.use_pty),
+            command,
+        ]
+
+        stdout_path, stderr_path = get_output_paths(
+            self.obj,
+            self.collect_results_path,
+            logs_prefix
+        )
+        self.process = Process(
+            self.args,
+            True,
+            stdout_path,
+            stderr_path,
+            capture_output
+        )
 
 
     @property
@@ -335,19 +880,30 @@ class RemoteRunner(IObjectRunner):
         return status
 
 
+    @property
+    def connection(self):
+        """
+        `fabric.Connection` to the remote machine shared by all the runners
+        working with this machine, reconnected if it has been dropped.
+        """
+        return get_connection(self.username, self.host)
+
+
     @staticmethod
-    def _create_directory(
-        dirpath: str,
+    def _create_directories(
+        dirpaths: typing.List[pathlib.Path],
         username: str,
         host: str
     ):
         """
-        Create directory on a remote machine via SSH for saving object 
-        results before starting the object.
+        Create directories on a remote machine via SSH for saving object 
+        results before starting the object. All the directories are
+        created via a single `mkdir -p` command, the directories already
+        created by the runners are skipped.
 
         Attributes:
-            dirpath:
-                `pathlib.Path` directory path.
+            dirpaths:
+                The list of `pathlib.Path` directory paths.
             username:
                 Username on the remote machine to connect through.
             host:
@@ -356,36 +912,52 @@ class RemoteRunner(IObjectRunner):
         Raises:
             SrtUtilsException
         """
+        with _CREATED_DIRS_LOCK:
+            dirpaths = [
+                dirpath for dirpath in dirpaths
+                if (username, host, dirpath) not in _CREATED_REMOTE_DIRS
+            ]
+
+        if not dirpaths:
+            return
+
         logger.info(
-            '[RemoteRunner] Creating directory for saving object artifacts '
-            f'remotely via SSH. Username: {username}, host: {host}, '
-            f'dirpath: {dirpath}'
+            '[RemoteRunner] Creating directories for saving object artifacts '
+            'remotely via SSH. Username: %s, host: %s, dirpaths: %s',
+            username, host, [str(dirpath) for dirpath in dirpaths]
         )
 
+        args = ' '.join(shlex.quote(str(dirpath)) for dirpath in dirpaths)
+
         try:
             # FIXME: By default Paramiko will attempt to connect to a running 
             # SSH agent (Unix style, e.g. a live SSH_AUTH_SOCK, or Pageant if 
             # one is on Windows). That's why promt for login-password is not 
             # disabled under condition that password is not configured via 
             # connect_kwargs.password
-            with fabric.Connection(host=host, user=username) as c:
-                result = c.run(f'mkdir -p {dirpath}')
+            c = get_connection(username, host)
+            result = c.run(f'mkdir -p {args}')
         except paramiko.ssh_exception.SSHException as error:
             raise SrtUtilsException(
-                f'Directory was not created: {dirpath}. Exception '
+                f'Directories were not created: {args}. Exception '
                 f'occurred ({error.__class__.__name__}): {error}. Check that '
                 'ssh-agent has been started before running the script'
             )
         except TimeoutError as error:
             raise SrtUtilsException(
-                f'Directory was not created: {dirpath}. Exception '
+                f'Directories were not created: {args}. Exception '
                 f'occurred ({error.__class__.__name__}): {error}. Check that '
                 'IP address of the remote machine is correct and the '
                 'machine is not down'
             )
 
         if result.exited != 0:
-            raise SrtUtilsException(f'Directory was not created: {dirpath}')
+            raise SrtUtilsException(f'Directories were not created: {args}')
+
+        with _CREATED_DIRS_LOCK:
+            _CREATED_REMOTE_DIRS.update(
+                (username, host, dirpath) for dirpath in dirpaths
+            )
 
 
     @classmethod
@@ -395,46 +967,143 @@ class RemoteRunner(IObjectRunner):
             config = {
                 'username': 'msharabayko',
                 'host': '10.129.10.91',
-                'collect_results_path': '_results_exp'      # optional
+                'collect_results_path': '_results_exp',     # optional
+                'transport': 'auto',                        # optional
+                'logs_prefix': 'task-1',                    # optional
+                'use_pty': True,                            # optional
+                'capture_output': True                      # optional
             }
         """
+        kwargs = {}
+
         if 'collect_results_path' in config:
-            return cls(
-                obj,
-                config['username'],
-                config['host'],
-                pathlib.Path(config['collect_results_path'])
+            kwargs['collect_results_path'] = pathlib.Path(
+                config['collect_results_path']
             )
 
-        return cls(obj, config['username'], config['host'])
+        if 'use_pty' in config:
+            kwargs['use_pty'] = config['use_pty']
+
+        if 'transport' in config:
+            kwargs['transport'] = config['transport']
+
+        if 'logs_prefix' in config:
+            kwargs['logs_prefix'] = config['logs_prefix']
+
+        if 'capture_output' in config:
+            kwargs['capture_output'] = config['capture_output']
+
+        return cls(obj, config['username'], config['host'], **kwargs)
+
+
+    @classmethod
+    def create_directories_bulk(cls, runners: typing.List['RemoteRunner']):
+        """
+        The directories needed by the objects run on the same remote machine
+        are created via a single `mkdir -p` command instead of one command
+        per object.
+        """
+        groups = {}
+        for runner in runners:
+            dirpaths = groups.setdefault((runner.username, runner.host), set())
+            for filepath in runner.obj.artifacts:
+                dirpaths.add(filepath.parent)
+
+        for (username, host), dirpaths in groups.items():
+            cls._create_directories(sorted(dirpaths), username, host)
 
 
     def start(self):
-        logger.info(f'Starting object remotely via SSH: {self.obj}')
-        logger.info(f'Arguments for RemoteRunner: {self.args}')
+        logger.info('Starting object remotely via SSH: %s', self.obj)
+        logger.info('Arguments for RemoteRunner: %s', self.args)
 
+        dirpaths = []
         for filepath in self.obj.artifacts:
-            self._create_directory(
-                filepath.parent,
-                self.username,
-                self.host
-            )
+            if filepath.parent not in dirpaths:
+                dirpaths.append(filepath.parent)
+
+        self._create_directories(dirpaths, self.username, self.host)
 
+        if self.process.stdout_path is not None:
+            ensure_local_directory(self.process.stdout_path.parent)
+
+        register_ssh_destination(self.username, self.host)
         self.process.start()
 
 
     def stop(self):
-        logger.info(f'Stopping object remotely via SSH: {self.obj}, {self.process}')
+        logger.info(
+            'Stopping object remotely via SSH: %s, %s',
+            self.obj, self.process
+        )
+
+        if not self.use_pty:
+            self._send_sigint()
+
         self.process.stop()
 
 
+    def _send_sigint(self):
+        """
+        Send SIGINT signal to the object running on a remote machine
+        without pseudo-terminal. ssh process finishes once the object
+        finishes, otherwise it is terminated in `Process.stop`. The file
+        with the object process id is removed in any case.
+
+        If the object has already finished, which is the case when ssh
+        process is not running any more, the signal is not sent, since
+        the process id might have been reused by another process.
+        """
+        if not self.process.is_started or self.process.is_stopped:
+            return
+
+        pidfile = shlex.quote(self.pidfile)
+
+        if self.status == Status.running:
+            logger.info(
+                'Sending SIGINT signal to the remote object: %s',
+                self.obj
+            )
+            command = (
+                f'kill -INT "$(cat {pidfile})"; code=$?; '
+                f'rm -f {pidfile}; exit $code'
+            )
+        else:
+            logger.info(
+                'Remote object has already finished, SIGINT signal is not '
+                'sent: %s',
+                self.obj
+            )
+            command = f'rm -f {pidfile}'
+
+        try:
+            result = self.connection.run(command, hide=True, warn=True)
+        except (paramiko.ssh_exception.SSHException, TimeoutError) as error:
+            logger.error(
+                'Failed to send SIGINT signal to the remote object: %s. '
+                'Exception occurred (%s): %s',
+                self.obj, error.__class__.__name__, error
+            )
+            return
+
+        if result.exited != 0:
+            logger.warning(
+                'Failed to send SIGINT signal to the remote object: %s. '
+                'stderr: %s',
+                self.obj, result.stderr
+            )
+
+
     def collect_results(self):
         """
         Before collecting object artifacts, this function creates a local 
         directory `username@host` inside self.collect_results_path directory
         where the results produced by the object are copied.
         """
-        logger.info(f'Collecting object artifacts: {self.obj}, {self.process}')
+        logger.info(
+            'Collecting object artifacts: %s, %s',
+            self.obj, self.process
+        )
 
         before_collect_results_checks(
             self.obj,
@@ -442,7 +1111,7 @@ class RemoteRunner(IObjectRunner):
             self.collect_results_path
         )
 
-        if self.obj.artifacts is []:
+        if not self.obj.artifacts:
             logger.info('There were no artifacts expected, nothing to collect')
             return
 
@@ -450,51 +1119,478 @@ class RemoteRunner(IObjectRunner):
         # (inside self.collect_results_path directory)
         destination_dir = self.collect_results_path / f'{self.username}@{self.host}'
         logger.info(
-            'Creating local directory for saving object artifacts: '
-            f'{destination_dir}'
+            'Creating local directory for saving object artifacts: %s',
+            destination_dir
         )
         _ = create_local_directory(destination_dir)
 
-        logger.info(f'Saving object artifacts into: {destination_dir}')
+        logger.info('Saving object artifacts into: %s', destination_dir)
+
+        c = self.connection
+
+        # Check which files exist on a remote machine and get their sizes
+        # for all the artifacts at once in order to save round trips. SFTP
+        # reports a missing file itself and does not need the size, so the
+        # check is skipped in this case. The files whose sizes are unknown,
+        # e.g. because the check has failed, are downloaded anyway
+        if self.transport == 'sftp':
+            sizes = {}
+        else:
+            sizes = self._get_file_sizes(c, self.obj.artifacts)
 
         for filepath in self.obj.artifacts:
-            logger.info(f'Saving file: {filepath}')
-
-            # Check if the file exists on a remote machine
-            with fabric.Connection(host=self.host, user=self.username) as c:
-                if not exists(c, filepath):
-                    stdout, stderr = self.process.collect_results()
-                    logger.warning(
-                        f'File {filepath} was not created by the object: '
-                        f'{self.obj}, nothing to collect. Process stdout: '
-                        f'{stdout}. Process stderr: {stderr}'
-                    )
-                    continue
+            logger.info('Saving file: %s', filepath)
+
+            size = sizes.get(filepath)
+            if filepath in sizes and size is None:
+                log_missing_artifact(self.obj, self.process, filepath)
+                continue
 
             # Check if there is no file with the same name on the local machine
             destination = destination_dir / filepath.name
 
-            if destination.exists():
+            if os.path.exists(destination):
                 logger.warning(
-                    'A file with the same name already exists. This might be a '
-                    f'file created by another object: {destination}. File '
-                    f'with object results was not copied: {filepath}'
+                    'A file with the same name already exists. This might be '
+                    'a file created by another object: %s. File with object '
+                    'results was not copied: %s',
+                    destination, filepath
                 )
                 continue
 
-            # TODO: Implement copying files using rsync
             try:
-                # http://docs.fabfile.org/en/2.3/api/transfer.html
-                with fabric.Connection(host=self.host, user=self.username) as c:
-                    _ = c.get(filepath, destination)
+                self._get_file(c, filepath, destination, size)
+            except FileNotFoundError:
+                # The local file is created before the remote one is opened
+                # by SFTP client, it is empty in this case
+                if os.path.exists(destination):
+                    os.remove(destination)
+                log_missing_artifact(self.obj, self.process, filepath)
+            except subprocess.CalledProcessError as error:
+                logger.error(
+                    'File %s was not saved. Exception occurred (%s): %s. ',
+                    filepath, error.__class__.__name__, error
+                )
             except OSError as error:
                 logger.error(
-                    f'File {filepath} was not saved. '
-                    f'Exception occurred ({error.__class__.__name__}): {error}. '
+                    'File %s was not saved. Exception occurred (%s): %s. ',
+                    filepath, error.__class__.__name__, error
                 )
             except Exception as error:
                 logger.error('Most probably paramiko exception')
                 logger.error(
-                    f'File {filepath} was not saved. '
-                    f'Exception occurred ({error.__class__.__name__}): {error}. '
-                )
\ No newline at end of file
+                    'File %s was not saved. Exception occurred (%s): %s. ',
+                    filepath, error.__class__.__name__, error
+                )
+
+
+    @classmethod
+    def collect_results_bulk(cls, runners: typing.List['RemoteRunner']):
+        """
+        The artifacts of the objects run on the same remote machine are
+        transferred as a single tar stream over one ssh session instead of
+        downloading them file by file. This is done only for the runners
+        with 'auto' transport, `collect_results` is used for the runners
+        with the transport set explicitly and if there is only one artifact
+        to collect from the machine. The artifacts from different remote
+        machines are collected in parallel.
+        """
+        groups = {}
+        for runner in runners:
+            key = (runner.username, runner.host, runner.collect_results_path)
+            groups.setdefault(key, []).append(runner)
+
+        if not groups:
+            return
+
+        max_workers = min(len(groups), 8)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(cls._collect_results_group, *key, group)
+                for key, group in groups.items()
+            ]
+
+        # Errors are logged while collecting the results, so the only
+        # thing left is to raise unexpected ones
+        for future in futures:
+            future.result()
+
+
+    @classmethod
+    def _collect_results_group(
+        cls,
+        username: str,
+        host: str,
+        collect_results_path: pathlib.Path,
+        runners: typing.List['RemoteRunner']
+    ):
+        """
+        Collect the artifacts of the objects run on the same remote machine
+        and saved into the same `collect_results_path` directory.
+        """
+        tar_runners = [
+            runner for runner in runners if runner.transport == 'auto'
+        ]
+        other_runners = [
+            runner for runner in runners if runner.transport != 'auto'
+        ]
+
+        if sum(len(runner.obj.artifacts) for runner in tar_runners) <= 1:
+            other_runners += tar_runners
+            tar_runners = []
+
+        super().collect_results_bulk(other_runners)
+
+        if not tar_runners:
+            return
+
+        try:
+            cls._collect_results_via_tar(
+                username,
+                host,
+                collect_results_path,
+                tar_runners
+            )
+        except SrtUtilsException as error:
+            logger.error(
+                'Failed to collect object results from the remote '
+                'machine: %s@%s. Reason: %s',
+                username, host, error
+            )
+
+
+    @staticmethod
+    def _collect_results_via_tar(
+        username: str,
+        host: str,
+        collect_results_path: pathlib.Path,
+        runners: typing.List['RemoteRunner']
+    ):
+        """
+        Collect the artifacts of the objects run on the same remote machine
+        by means of `tar` started remotely via SSH. The archive is streamed
+        through ssh stdout and unpacked on the fly into `username@host`
+        directory inside `collect_results_path` directory.
+
+        Attributes:
+            username:
+                Username on the remote machine to connect through.
+            host:
+                IP address of the remote machine to connect.
+            collect_results_path:
+                `pathlib.Path` directory path where the results produced by 
+                the objects should be copied.
+            runners:
+                The list of `RemoteRunner` runners.
+
+        Raises:
+            SrtUtilsException
+        """
+        # Artifacts to collect and the runners they belong to
+        filepaths = {}
+
+        for runner in runners:
+            logger.info(
+                'Collecting object artifacts: %s, %s',
+                runner.obj, runner.process
+            )
+
+            try:
+                before_collect_results_checks(
+                    runner.obj,
+                    runner.process,
+                    collect_results_path
+                )
+            except SrtUtilsException as error:
+                logger.error(
+                    'Failed to collect object results: %s. Reason: %s',
+                    runner.obj, error
+                )
+                continue
+
+            for filepath in runner.obj.artifacts:
+                filepaths[filepath] = runner
+
+        if not filepaths:
+            logger.info('There were no artifacts expected, nothing to collect')
+            return
+
+        destination_dir = collect_results_path / f'{username}@{host}'
+        logger.info(
+            'Creating local directory for saving object artifacts: %s',
+            destination_dir
+        )
+        _ = create_local_directory(destination_dir)
+
+        for filepath in list(filepaths):
+            destination = destination_dir / filepath.name
+
+            if os.path.exists(destination):
+                logger.warning(
+                    'A file with the same name already exists. This might be '
+                    'a file created by another object: %s. File with object '
+                    'results was not copied: %s',
+                    destination, filepath
+                )
+                del filepaths[filepath]
+
+        if not filepaths:
+            return
+
+        logger.info(
+            'Saving object artifacts into: %s. Files: %s',
+            destination_dir, list(filepaths)
+        )
+
+        tar_cmd = ' '.join(
+            ['tar', 'cf', '-'] + [shlex.quote(str(p)) for p in filepaths]
+        )
+        args = [*get_ssh_args(username, host, use_pty=False), tar_cmd]
+        register_ssh_destination(username, host)
+
+        # stderr is written into a temporary file rather than a pipe, since
+        # it is not read while the archive is being received, and a lot of
+        # errors, e.g. about missing files, would fill the pipe and block tar
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                process = subprocess.Popen(
+                    args,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file
+                )
+            except OSError as error:
+                raise SrtUtilsException(
+                    f'Process has not been started: {args}. {error}'
+                )
+
+            received = RemoteRunner._receive_tar(process, destination_dir)
+            stderr_file.seek(0)
+            tar_stderr = stderr_file.read()
+
+        if process.returncode != 0:
+            logger.warning(
+                'Remote tar has finished with returncode %s. stderr: %s',
+                process.returncode, tar_stderr
+            )
+
+        for filepath, runner in filepaths.items():
+            if filepath.name in received:
+                continue
+
+            log_missing_artifact(runner.obj, runner.process, filepath)
+
+
+    @staticmethod
+    def _receive_tar(
+        process: subprocess.Popen,
+        destination_dir: pathlib.Path
+    ):
+        """
+        Unpack the tar stream read from process stdout into `destination_dir`
+        directory and wait for the process to finish. If the stream can not
+        be unpacked, the process is killed, so that the rest of the archive
+        is not transferred.
+
+        Attributes:
+            process:
+                `subprocess.Popen` process writing the archive to stdout.
+            destination_dir:
+                `pathlib.Path` directory path to save the files into.
+
+        Returns:
+            The set of names of the files saved.
+        """
+        received = set()
+
+        try:
+            with tarfile.open(fileobj=process.stdout, mode='r|') as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+
+                    # Files are saved without the directory structure, the
+                    # same way as it is done in `collect_results`
+                    filename = pathlib.PurePosixPath(member.name).name
+                    destination = destination_dir / filename
+
+                    try:
+                        with destination.open(mode='xb') as fid:
+                            shutil.copyfileobj(tar.extractfile(member), fid)
+                    except FileExistsError:
+                        logger.error(
+                            'The destination file already exists, there might '
+                            'be a file created by another object: %s. File '
+                            'with object results was not copied: %s',
+                            destination, member.name
+                        )
+                        continue
+
+                    received.add(filename)
+
+            # tar pads the archive after the end-of-archive marker, the
+            # padding is read so that tar does not fail on writing it
+            while process.stdout.read(TAR_READ_SIZE):
+                pass
+        except tarfile.TarError as error:
+            logger.error(
+                'Failed to unpack the artifacts received from the remote '
+                'machine. Exception occurred (%s): %s',
+                error.__class__.__name__, error
+            )
+            process.kill()
+        finally:
+            process.stdout.close()
+            process.wait()
+
+        return received
+
+
+    @staticmethod
+    def _get_file_sizes(
+        c: fabric.Connection,
+        filepaths: typing.List[pathlib.Path]
+    ):
+        """
+        Get the sizes of the files on a remote machine via a single command.
+
+        Attributes:
+            c:
+                `fabric.Connection` to the remote machine.
+            filepaths:
+                The list of `pathlib.Path` file paths on the remote machine.
+
+        Returns:
+            A dictionary mapping file paths to file sizes in bytes, the size
+            is None if the file does not exist. The files whose sizes could
+            not be obtained, e.g. because the command has failed or its
+            output could not be parsed, are not included.
+        """
+        # One line is printed per file, either its size or '-' if it is not
+        # a regular file or can not be read
+        args = ' '.join(shlex.quote(str(filepath)) for filepath in filepaths)
+
+        try:
+            result = c.run(
+                f'for f in {args}; do '
+                '[ -f "$f" ] && wc -c < "$f" 2>/dev/null || echo -; '
+                'done',
+                hide=True,
+                warn=True
+            )
+        except (paramiko.ssh_exception.SSHException, OSError) as error:
+            logger.warning(
+                'Failed to get the sizes of the files on the remote machine, '
+                'the files are downloaded anyway. Exception occurred (%s): %s',
+                error.__class__.__name__, error
+            )
+            return {}
+
+        lines = result.stdout.split()
+
+        if result.exited != 0 or len(lines) != len(filepaths):
+            logger.warning(
+                'Failed to get the sizes of the files on the remote machine, '
+                'the files are downloaded anyway. Exit code: %s, stdout: %s, '
+                'stderr: %s',
+                result.exited, result.stdout, result.stderr
+            )
+            return {}
+
+        sizes = {}
+
+        for filepath, line in zip(filepaths, lines):
+            if line == '-':
+                sizes[filepath] = None
+            elif line.isdigit():
+                sizes[filepath] = int(line)
+
+        return sizes
+
+
+    def _get_file(
+        self,
+        c: fabric.Connection,
+        source: pathlib.Path,
+        destination: pathlib.Path,
+        size: typing.Optional[int]
+    ):
+        """
+        Download the file from a remote machine using the transport
+        specified for the runner.
+
+        Attributes:
+            c:
+                `fabric.Connection` to the remote machine.
+            source:
+                `pathlib.Path` file path on the remote machine.
+            destination:
+                `pathlib.Path` file path on the local machine.
+            size:
+                File size in bytes, None if unknown. If the size is unknown,
+                'auto' transport downloads the file via SFTP.
+
+        Raises:
+            FileNotFoundError:
+                If the file does not exist on the remote machine and is
+                downloaded via SFTP.
+            OSError, subprocess.CalledProcessError
+        """
+        transport = self.transport
+
+        if transport == 'auto':
+            use_scp = size is not None and size >= SCP_MIN_FILE_SIZE
+            transport = 'scp' if use_scp else 'sftp'
+
+        if transport != 'sftp' and not shutil.which(transport):
+            transport = 'sftp'
+
+        # Depending on OpenSSH version, scp either expands the remote path in
+        # a shell on the remote machine (legacy protocol) or takes it as is
+        # (SFTP protocol, the default since OpenSSH 9.0). The paths which
+        # would be interpreted differently are downloaded via sftp instead
+        if transport == 'scp' and shlex.quote(str(source)) != str(source):
+            transport = 'sftp'
+
+        if size is None:
+            logger.info('Downloading file via %s: %s', transport, source)
+        else:
+            logger.info(
+                'Downloading file via %s: %s, %s bytes',
+                transport, source, size
+            )
+
+        if transport == 'scp':
+            register_ssh_destination(self.username, self.host)
+            subprocess.run(
+                [
+                    'scp',
+                    '-q',
+                    *SSH_OPTIONS,
+                    f'{self.username}@{self.host}:{source}',
+                    str(destination),
+                ],
+                stdin=subprocess.DEVNULL,
+                check=True
+            )
+            return
+
+        if transport == 'rsync':
+            register_ssh_destination(self.username, self.host)
+            rsh = ' '.join(shlex.quote(arg) for arg in SSH_NO_PTY_ARGS)
+            subprocess.run(
+                [
+                    'rsync',
+                    '-q',
+                    '--protect-args',
+                    '-e', rsh,
+                    f'{self.username}@{self.host}:{source}',
+                    str(destination),
+                ],
+                stdin=subprocess.DEVNULL,
+                check=True
+            )
+            return
+
+        # http://docs.fabfile.org/en/2.3/api/transfer.html
+        _ = c.get(str(source), str(destination))
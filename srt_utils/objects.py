@@ -1,12 +1,11 @@
 """ The module with IObject interface and its implementations. """
 from abc import abstractmethod, ABC
 import enum
-import logging
 import pathlib
+import shlex
 import typing
 
-
-logger = logging.getLogger(__name__)
+from srt_utils.exceptions import SrtUtilsException
 
 
 @enum.unique
@@ -23,12 +22,16 @@ class SrtApplicationType(enum.Enum):
     forwarder = "fwd"
 
 
+# srt-xtransmit subcommands depending on the type of the application
+XTRANSMIT_SUBCOMMANDS = {
+    SrtApplicationType.sender: 'generate',
+    SrtApplicationType.receiver: 'receive',
+}
+
+
 def get_query(attrs_values: typing.List[typing.Tuple[str, str]]):
     """ Get query out of the list of attributes-values pairs. """
-    query_elements = []
-    for attr, value in attrs_values:
-        query_elements.append(f'{attr}={value}')
-    return f'{"&".join(query_elements)}'
+    return '&'.join(f'{attr}={value}' for attr, value in attrs_values)
 
 
 class IObject(ABC):
@@ -40,6 +43,8 @@ class IObject(ABC):
     or 3) whatever we might need to run in future setups.
     """
 
+    __slots__ = ('name', 'artifacts', '_args', '_str')
+
     def __init__(self, name: str):
         # Object name
         self.name = name
@@ -48,10 +53,14 @@ class IObject(ABC):
         # statistics in case of srt-live-transmit or srt-xtransmit, paths to
         # those files should be stored in self.artifacts.
         self.artifacts = []
+        # Arguments to start the object and the command string made out of
+        # them, built once on the first request
+        self._args = None
+        self._str = None
 
 
     def __str__(self):
-        return f'{self.name}'
+        return self.name
 
 
     @classmethod
@@ -69,28 +78,47 @@ class IObject(ABC):
         pass
 
 
-    @abstractmethod
     def make_args(self):
         """
         Make and return the list of arguments to start the object via
-        `LocalRunner` runner. The examples can be found in interface 
-        implementations.
+        `LocalRunner` runner.
+
+        The arguments are built by `_make_args` on the first call and then
+        reused. A new list is returned each time, so that the caller can
+        modify it.
         """
-        pass
+        if self._args is None:
+            self._args = tuple(self._make_args())
+        return list(self._args)
 
 
     @abstractmethod
+    def _make_args(self):
+        """
+        Build the list of arguments to start the object. The examples can
+        be found in interface implementations.
+        """
+        pass
+
+
     def make_str(self):
         """
         Make and return the string for command needs to be launched on a
-        remote machine via `RemoteRunner` runner. The examples can be
+        remote machine via `RemoteRunner` runner. Each argument returned by
+        `make_args` is quoted as per POSIX shell rules, so that the command
+        is parsed into the same arguments on a remote machine. The string
+        is built on the first call and then reused. The examples can be
         found in interface implementations.
         """
-        pass
+        if self._str is None:
+            self._str = ' '.join(shlex.quote(arg) for arg in self.make_args())
+        return self._str
 
 
 class Tshark(IObject):
 
+    __slots__ = ('path', 'interface', 'port', 'tracefile_path')
+
     def __init__(
         self,
         path: str,
@@ -119,7 +147,7 @@ class Tshark(IObject):
         self.interface = interface
         self.port = port
         self.tracefile_path = tracefile_path
-        self.artifacts += [pathlib.Path(tracefile_path)]
+        self.artifacts.append(pathlib.Path(tracefile_path))
 
     @classmethod
     def from_config(cls, config: dict):
@@ -140,7 +168,7 @@ class Tshark(IObject):
         )
 
 
-    def make_args(self):
+    def _make_args(self):
         """
         Command
         tshark -i en0 -f "udp port 4200" -s 1500 -w _tmp/snd-tracefile.pcapng
@@ -172,17 +200,26 @@ class Tshark(IObject):
         when running through `RemoteRunner` based on Python `subprocess` module.
 
         Here we construct and return only the command string
-        'tshark -i en0 -f "udp port 4200" -s 1500 -w _tmp/snd-tracefile.pcapng'
+        tshark -i en0 -f 'udp port 4200' -s 1500 -w _tmp/snd-tracefile.pcapng
 
         SSH related arguments are added on top of that in `RemoteRunner` class.
         """
-        args = [f'"{arg}"' if ' ' in arg else arg for arg in self.make_args()]
-        args_str = ' '.join(args)
-        return args_str
+        return super().make_str()
 
 
 class SrtXtransmit(IObject):
 
+    __slots__ = (
+        'xtransmit_type',
+        'path',
+        'port',
+        'host',
+        'attrs_values',
+        'options_values',
+        '_subcommand',
+        '_uri',
+    )
+
     def __init__(
         self,
         xtransmit_type: str,
@@ -216,14 +253,34 @@ class SrtXtransmit(IObject):
             options_values:
                 Application options, optional. Format: [('option1', 'value1'), ('option2', 'value2'), ...],
                 e.g. [('--msgsize', '1316'), ('--statsfile', '_results/srt-rcv-stats.csv'), ('--statsfreq', '1s')].
+
+        Raises:
+            SrtUtilsException
         """
         super().__init__('srt-xtransmit')
-        self.xtransmit_type = xtransmit_type
+
+        if options_values is None:
+            options_values = []
+
+        try:
+            self.xtransmit_type = SrtApplicationType(xtransmit_type)
+        except ValueError:
+            raise SrtUtilsException(
+                f'Unknown type of srt-xtransmit application: {xtransmit_type}'
+            )
+
         self.path = path
         self.port = port
         self.host = host
         self.attrs_values = attrs_values
         self.options_values = options_values
+        # srt-xtransmit subcommand, there is none for a forwarder
+        self._subcommand = XTRANSMIT_SUBCOMMANDS.get(self.xtransmit_type)
+
+        # SRT URI does not change once the object is created
+        self._uri = f'srt://{self.host}:{self.port}'
+        if self.attrs_values is not None:
+            self._uri += f'?{get_query(self.attrs_values)}'
 
         options = dict(self.options_values)
 
@@ -255,17 +312,25 @@ class SrtXtransmit(IObject):
                 }
             }
         """
+        attrs_values = config.get('attrs_values')
+        if attrs_values is not None:
+            attrs_values = list(attrs_values.items())
+
+        options_values = config.get('options_values')
+        if options_values is not None:
+            options_values = list(options_values.items())
+
         return cls(
             config['type'],
             config['path'],
             config['port'],
             config.get('host', ''),
-            list(config.get('attrs_values').items()),
-            list(config.get('options_values').items())
+            attrs_values,
+            options_values
         )
 
 
-    def make_args(self):
+    def _make_args(self):
         """
         Command
         projects/srt-xtransmit/_build/bin/srt-xtransmit receive 
@@ -280,24 +345,17 @@ class SrtXtransmit(IObject):
 
         to run through `LocalRunner` based on Python `subprocess` module.
         """
-        args = []
-        args += [f'{self.path}']
-
-        if self.xtransmit_type == SrtApplicationType.sender.value:
-            args += ['generate']
+        args = [self.path]
 
-        if self.xtransmit_type == SrtApplicationType.receiver.value:
-            args += ['receive']
+        if self._subcommand is not None:
+            args.append(self._subcommand)
 
-        if self.attrs_values is not None:
-            args += [f'srt://{self.host}:{self.port}?{get_query(self.attrs_values)}']
-        else:
-            args += [f'srt://{self.host}:{self.port}']
+        args.append(self._uri)
 
         for option, value in self.options_values:
-            args += [option]
+            args.append(option)
             if value:
-                args += [value]
+                args.append(value)
 
         return args
 
@@ -319,12 +377,10 @@ class SrtXtransmit(IObject):
         when running through `RemoteRunner` based on Python `subprocess` module.
 
         Here we construct and return only the command string
-        'projects/srt-xtransmit/_build/bin/srt-xtransmit receive
-        "srt://:4200?rcvbuf=1000000000&sndbuf=1000000000&latency=400"
-        --msgsize 1316 --statsfile _results/srt-rcv-stats.csv --statsfreq 1s'
+        projects/srt-xtransmit/_build/bin/srt-xtransmit receive
+        'srt://:4200?rcvbuf=1000000000&sndbuf=1000000000&latency=400'
+        --msgsize 1316 --statsfile _results/srt-rcv-stats.csv --statsfreq 1s
 
         SSH related arguments are added on top of that in `RemoteRunner` class.
         """
-        args = [f'"{arg}"' if arg.startswith('srt://') else arg for arg in self.make_args()]
-        args_str = ' '.join(args)
-        return args_str
\ No newline at end of file
+        return super().make_str()
\ No newline at end of file
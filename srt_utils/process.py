@@ -1,7 +1,11 @@
 import logging
+import os
+import pathlib
+import select
 import signal
 import subprocess
 import sys
+import threading
 import time
 import typing
 
@@ -13,11 +17,57 @@ logger = logging.getLogger(__name__)
 
 
 SSH_CONNECTION_TIMEOUT = 10
+# Time in seconds the local process should keep running after the start in
+# order to be considered started successfully
+PROCESS_STARTUP_GRACE_PERIOD = 0.5
+# Time in seconds to wait for the threads reading process stdout and stderr
+# pipes to finish once the results are collected
+READER_JOIN_TIMEOUT = 3
+
+
+def read_stream(stream: typing.BinaryIO, lines: typing.List[bytes]):
+    """
+    Helper function used to read the process output stream line by line
+    until the stream is closed. Runs in a separate thread, so that the pipe
+    is drained while the process is running and the process does not block
+    on writing once the pipe buffer is full.
+
+    Attributes:
+        stream:
+            Process stdout or stderr pipe.
+        lines:
+            The list to append the lines read to.
+    """
+    with stream:
+        for line in iter(stream.readline, b''):
+            lines.append(line)
 
 
 class Process:
 
-    def __init__(self, args: typing.List[str], via_ssh: bool=False):
+    __slots__ = (
+        'args',
+        'via_ssh',
+        'stdout_path',
+        'stderr_path',
+        'capture_output',
+        'process',
+        'id',
+        'is_started',
+        'is_stopped',
+        'stdout_lines',
+        'stderr_lines',
+        'readers',
+    )
+
+    def __init__(
+        self,
+        args: typing.List[str],
+        via_ssh: bool=False,
+        stdout_path: typing.Optional[pathlib.Path]=None,
+        stderr_path: typing.Optional[pathlib.Path]=None,
+        capture_output: bool=True
+    ):
         """
         Helper class to work with Python `subprocess` module.
 
@@ -27,13 +77,34 @@ class Process:
             via_ssh:
                 True/False depending on whether the arguments `args` contain
                 SSH related ones.
+            stdout_path:
+                `pathlib.Path` file path to write process stdout to, optional.
+                If not specified, stdout is piped and kept in memory until
+                the results are collected.
+            stderr_path:
+                `pathlib.Path` file path to write process stderr to, optional.
+                If not specified, stderr is piped and kept in memory until
+                the results are collected.
+            capture_output:
+                True/False depending on whether process stdout and stderr,
+                if not written to the files, should be kept in memory until
+                the results are collected or discarded. By default, the
+                output is kept.
         """
         self.args = args
         # TODO: change via_ssh to timeouts (for start, for stop - depending on object and 
         # whether it is started via ssh or locally)
         self.via_ssh = via_ssh
+        self.stdout_path = stdout_path
+        self.stderr_path = stderr_path
+        self.capture_output = capture_output
         self.process = None
         self.id = None
+        # Lines read from stdout and stderr pipes by the reader threads,
+        # if the output is not written to the files
+        self.stdout_lines = []
+        self.stderr_lines = []
+        self.readers = []
         self.is_started = False
         self.is_stopped = False
 
@@ -60,12 +131,17 @@ class Process:
                 If the process has been started successfully, but is not
                 running at the moment of getting status.
         """
-        if self.process == None:
+        if self.process is None:
             return (Status.idle, None)
 
         if not self.is_started:
             return (Status.idle, None)
 
+        # Once the process has been stopped, there is no need to poll it
+        # again, the returncode has already been obtained during stopping
+        if self.is_stopped:
+            return (Status.idle, self.process.returncode)
+
         returncode = self.process.poll()
         status = Status.running if returncode is None else Status.idle
         return (status, returncode)
@@ -86,58 +162,189 @@ class Process:
                 'Start can not be done'
             )
 
+        # If the file paths are specified, the output is written by the
+        # process directly into the files instead of being kept in memory.
+        # The output which is not captured is discarded by the kernel
+        pipe = subprocess.PIPE if self.capture_output else subprocess.DEVNULL
+        stdout = pipe
+        stderr = pipe
+
         try:
+            if self.stdout_path is not None:
+                stdout = self.stdout_path.open(mode='ab')
+
+            if self.stderr_path is not None:
+                stderr = self.stderr_path.open(mode='ab')
+
             if sys.platform == 'win32':
                 self.process = subprocess.Popen(
                     self.args, 
                     stdin =subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stdout=stdout,
+                    stderr=stderr,
                     universal_newlines=False,
                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-                    bufsize=1
+                    bufsize=-1
                 )
             else:
                 self.process = subprocess.Popen(
                     self.args, 
                     stdin =subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stdout=stdout,
+                    stderr=stderr,
                     #universal_newlines=False,
-                    bufsize=1
+                    bufsize=-1
                 )
                 self.is_started = True
         except OSError as error:
             raise SrtUtilsException(
                 f'Process has not been started: {self.args}. {error}'
             )
+        finally:
+            # The files are inherited by the process, there is no need
+            # to keep them open in the parent one
+            for stream in (stdout, stderr):
+                if stream is not pipe:
+                    stream.close()
+
+        if self.capture_output:
+            if self.stdout_path is None:
+                self._start_reader(self.process.stdout, self.stdout_lines)
+
+            if self.stderr_path is None:
+                self._start_reader(self.process.stderr, self.stderr_lines)
     
         # TODO: Adjust timers
         # Check that the process has started successfully and has not terminated
-        # because of an error
+        # because of an error. The process is waited for, so that a failure is
+        # reported as soon as the process exits. A local process still running
+        # after a short grace period is considered started. ssh process is
+        # waited for until the connection timeout expires, since it fails only
+        # once the connection to the remote machine can not be established
+        # NOTE: Errors happening later, e.g. when starting the caller first and
+        # there is no listener yet, are not detected here, the process status
+        # should be checked by the caller while the object is running
         if self.via_ssh:
-            time.sleep(SSH_CONNECTION_TIMEOUT + 1)
+            startup_timeout = SSH_CONNECTION_TIMEOUT + 1
         else:
-            # FIXME: Find a better solution, I changed the time from 1 to 5 s,
-            # cause it was not enough in case of errors with srt-test-messaging
-            # app, e.g. when starting the caller first and there is no listener yet
-            # NOTE: A good thing to consider - what would be in case the child process
-            # finfishes its work earlier than the time specified (5s). It is
-            # important to consider especially in case of fsrt and small files
-            # transmission.
-            time.sleep(5)
+            startup_timeout = PROCESS_STARTUP_GRACE_PERIOD
+
+        self.wait(startup_timeout)
 
         status, returncode = self.status
         if status == Status.idle:
+            stdout, stderr = self._read_output()
             raise SrtUtilsException(
                 f'Process has not been started: {self.args}, returncode: '
-                f'{returncode}, stdout: {self.process.stdout.readlines()}, '
-                f'stderr: {self.process.stderr.readlines()}'
+                f'{returncode}, stdout: {stdout}, stderr: {stderr}'
             )
 
         self.id = self.process.pid
 
 
+    def _start_reader(
+        self,
+        stream: typing.BinaryIO,
+        lines: typing.List[bytes]
+    ):
+        """
+        Start the thread reading process output stream into `lines`.
+        """
+        reader = threading.Thread(
+            target=read_stream,
+            args=(stream, lines),
+            daemon=True
+        )
+        reader.start()
+        self.readers.append(reader)
+
+
+    def _join_readers(self):
+        """
+        Wait for the threads reading process stdout and stderr pipes to
+        read the output till the end. If the pipes are still open after
+        `READER_JOIN_TIMEOUT` seconds, e.g. because they are inherited by
+        a child process still running, the output read so far is used.
+        """
+        deadline = time.monotonic() + READER_JOIN_TIMEOUT
+        for reader in self.readers:
+            reader.join(max(deadline - time.monotonic(), 0))
+
+
+    def wait(self, timeout: typing.Optional[float]=None):
+        """
+        Wait for the process to finish.
+
+        On Linux 5.3+ the process file descriptor obtained via
+        `os.pidfd_open` is waited for, on macOS and BSD a kqueue process exit
+        event is used, so that the caller is woken up by the kernel as soon
+        as the process exits instead of polling it periodically. On other
+        platforms, `subprocess.Popen.wait` is used.
+
+        Attributes:
+            timeout:
+                Maximum time to wait in seconds, optional. If not specified,
+                wait until the process finishes.
+
+        Returns:
+            Process returncode or None if the process is still running
+            after `timeout` seconds.
+
+        Raises:
+            SrtUtilsException
+        """
+        if not self.is_started:
+            raise SrtUtilsException(
+                'Process has not been started yet. Wait can not be done'
+            )
+
+        # The process is not reaped until its returncode is obtained, so
+        # its pid can not be reused by another process while waiting
+        returncode = self.process.poll()
+        if returncode is not None:
+            return returncode
+
+        pid = self.process.pid
+
+        if hasattr(os, 'pidfd_open'):
+            try:
+                fd = os.pidfd_open(pid)
+            except OSError:
+                # pidfd_open is not supported by the kernel
+                fd = None
+
+            if fd is not None:
+                try:
+                    poller = select.poll()
+                    poller.register(fd, select.POLLIN)
+                    poller.poll(None if timeout is None else timeout * 1000)
+                finally:
+                    os.close(fd)
+                return self.process.poll()
+
+        if hasattr(select, 'kqueue'):
+            kq = select.kqueue()
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT
+            )
+            try:
+                kq.control([event], 1, timeout)
+            except ProcessLookupError:
+                # The process has exited before the event was registered
+                pass
+            finally:
+                kq.close()
+            return self.process.poll()
+
+        try:
+            return self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
+
     def _terminate(self):
         """
         Terminate process.
@@ -162,11 +369,8 @@ class Process:
         logger.debug('Sending SIGINT/CTRL_C_EVENT signal')
         sig = signal.CTRL_C_EVENT if sys.platform == 'win32' else signal.SIGINT
         self.process.send_signal(sig)
-        for i in range(3):
-            time.sleep(1)
-            status, _ = self.status
-            if status == Status.idle:
-                return
+        if self.wait(3) is not None:
+            return
 
         raise SrtUtilsException(f'Process has not been terminated: {self.id}')
 
@@ -193,7 +397,7 @@ class Process:
             return
 
         self.process.kill()
-        time.sleep(1)
+        self.wait(1)
 
         status, _ = self.status
         if status == Status.running:
@@ -261,6 +465,12 @@ class Process:
         """
         Collect process results: stderr, stdout.
 
+        Returns:
+            A tuple of stdout and stderr. Each of them is either a list of
+            lines if the output has been piped, a `pathlib.Path` file path
+            if the output has been written to the file, or None if the output
+            has been discarded.
+
         Raises:
             SrtUtilsException
         """
@@ -270,7 +480,42 @@ class Process:
                 f'Can not collect results'
             )
 
-        stdout = self.process.stdout.readlines()
-        stderr = self.process.stderr.readlines()
+        self._join_readers()
+
+        stdout = self.stdout_path
+        stderr = self.stderr_path
+
+        if stdout is None and self.capture_output:
+            stdout = list(self.stdout_lines)
+
+        if stderr is None and self.capture_output:
+            stderr = list(self.stderr_lines)
+
+        return stdout, stderr
+
+
+    def _read_output(self):
+        """
+        Read process stdout and stderr either from the pipes or from
+        the files depending on where the output is written to.
+
+        Returns:
+            A tuple of stdout and stderr lists of lines. The output which
+            has been discarded is returned as None.
+        """
+        self._join_readers()
+
+        stdout = None
+        stderr = None
+
+        if self.stdout_path is not None:
+            stdout = self.stdout_path.read_bytes().splitlines(keepends=True)
+        elif self.capture_output:
+            stdout = list(self.stdout_lines)
+
+        if self.stderr_path is not None:
+            stderr = self.stderr_path.read_bytes().splitlines(keepends=True)
+        elif self.capture_output:
+            stderr = list(self.stderr_lines)
 
         return stdout, stderr
\ No newline at end of file
@@ -8,6 +8,7 @@ from srt_utils.exceptions import SrtUtilsException
 # from srt_utils.logutils import ContextualLoggerAdapter
 import srt_utils.objects as objects
 import srt_utils.object_runners as object_runners
+import srt_utils.ssh_pool as ssh_pool
 
 
 # LOGGER = logging.getLogger(__name__)
@@ -26,7 +27,7 @@ class SimpleFactory:
         elif obj_type == 'srt-xtransmit':
             obj = objects.SrtXtransmit.from_config(obj_config)
         else:
-            print('No matching object found')
+            logger.error(f'No matching object found: {obj_type}')
 
         return obj
 
@@ -38,7 +39,7 @@ class SimpleFactory:
         elif runner_type == 'remote-runner':
             runner = object_runners.RemoteRunner.from_config(obj, runner_config)
         else:
-            print('No matching runner found')
+            logger.error(f'No matching runner found: {runner_type}')
 
         return runner
 
@@ -135,11 +136,12 @@ class SingleExperimentRunner:
         for key, config in tasks:
             config['obj_config']['prefix'] = key
             config['runner_config']['collect_results_path'] = self.collect_results_path
+            config['runner_config']['logs_prefix'] = key
 
             obj = factory.create_object(config['obj_type'], config['obj_config'])
             obj_runner = factory.create_runner(obj, config['runner_type'], config['runner_config'])
 
-            self.tasks += [Task(key, obj, obj_runner, config)]
+            self.tasks.append(Task(key, obj, obj_runner, config))
 
         self.is_started = False
         self.is_stopped = False
@@ -171,6 +173,20 @@ class SingleExperimentRunner:
             )
 
 
+    def _runners_by_type(self):
+        """
+        Group object runners of the experiment tasks by runner type.
+
+        Returns:
+            A dict where keys are runner classes and values are the lists
+            of runners in the order of tasks.
+        """
+        runners = {}
+        for task in self.tasks:
+            runners.setdefault(type(task.obj_runner), []).append(task.obj_runner)
+        return runners
+
+
     @classmethod
     def from_config(cls, config: dict):
         """
@@ -206,6 +222,16 @@ class SingleExperimentRunner:
 
         self._create_directory(self.collect_results_path)
 
+        # The directories created by the previous experiments might have
+        # been removed since then
+        object_runners.forget_created_directories()
+
+        # Directories for saving object results are created for the runners
+        # of the same type at once, e.g., `RemoteRunner` creates all the
+        # directories needed on a remote machine via a single command
+        for runner_class, class_runners in self._runners_by_type().items():
+            runner_class.create_directories_bulk(class_runners)
+
         for task in self.tasks:
             logging.info(f'Starting task: {task}')
             task.obj_runner.start()
@@ -285,17 +311,18 @@ class SingleExperimentRunner:
                 'Experiment is still running. Can not collect results'
             )
 
-        for task in self.tasks:
-            logging.info(f'Collecting task results: {task}')
-            # This try/except block is needed here in order to collect results
-            # for as much tasks as we can in case of something has failed
-            try:
-                task.obj_runner.collect_results()
-            except SrtUtilsException as error:
-                logger.error(
-                    f'Failed to collect task results: {task}. Reason: {error}'
-                )
-                continue
+        # The results are collected for the runners of the same type at once,
+        # so that the runners are able to batch the transfers, e.g., 
+        # `RemoteRunner` collects all the artifacts from a remote machine
+        # via a single ssh session. Errors are logged by the runners in order
+        # to collect results for as much tasks as we can in case of something
+        # has failed
+        for runner_class, class_runners in self._runners_by_type().items():
+            runner_class.collect_results_bulk(class_runners)
+
+        # The experiment is over, there is no need to keep the connections
+        # to the remote machines open any longer
+        ssh_pool.release_all()
 
 
     def clean_up(self):
@@ -331,6 +358,9 @@ class SingleExperimentRunner:
                         not_stopped_tasks += 1
                         continue
 
+        ssh_pool.release_all()
+        object_runners.forget_created_directories()
+
         if not_stopped_tasks != 0:
             raise SrtUtilsException(
                 'Not all the tasks have been stopped during cleaning up'
@@ -0,0 +1,157 @@
+""" The module with the pool of SSH connections to remote machines. """
+import atexit
+import logging
+import threading
+
+import fabric
+import paramiko
+
+
+logger = logging.getLogger(__name__)
+
+
+SSH_CONNECTION_TIMEOUT = 10
+# NOTE: Keepalive messages are sent every SSH_POOL_KEEPALIVE_INTERVAL seconds
+# over the pooled connections, so that a connection dropped silently by the
+# server or a firewall in between is detected and its transport becomes
+# inactive. Such a connection is then established again on the next request.
+# The connections are never closed because of being idle, since they are
+# shared by several threads and one of them might be in the middle of
+# a transfer
+SSH_POOL_KEEPALIVE_INTERVAL = 30
+
+# The first identity provided by ssh-agent, loaded once per process in
+# order not to re-query the agent every time a connection is established
+_AGENT_KEY = None
+_AGENT_KEY_LOADED = False
+# Connections to remote machines are established once per (username, host)
+# pair and then reused by all the runners working with this machine in
+# order not to pay TCP + SSH handshake and authentication cost per call.
+# The pool itself is guarded by _CONNECTIONS_LOCK, while a connection is
+# opened under its own lock from _CONNECTION_LOCKS, so that an unreachable
+# machine does not block opening the connections to the other ones
+_CONNECTIONS = {}
+_CONNECTION_LOCKS = {}
+_CONNECTIONS_LOCK = threading.RLock()
+
+
+def get_agent_key():
+    """
+    Helper function which loads the first identity available in the running
+    ssh-agent. The identity is loaded only once and then reused for all
+    the connections established via `fabric`.
+
+    Returns:
+        `paramiko.AgentKey` object or None if ssh-agent is not running
+        or has no identities.
+    """
+    global _AGENT_KEY, _AGENT_KEY_LOADED
+
+    if _AGENT_KEY_LOADED:
+        return _AGENT_KEY
+
+    _AGENT_KEY_LOADED = True
+
+    try:
+        keys = paramiko.Agent().get_keys()
+    except paramiko.ssh_exception.SSHException as error:
+        logger.warning(
+            'Failed to load identities from ssh-agent. Exception occurred '
+            '(%s): %s',
+            error.__class__.__name__, error
+        )
+        return None
+
+    if keys:
+        _AGENT_KEY = keys[0]
+
+    return _AGENT_KEY
+
+
+def create_connection(username: str, host: str):
+    """
+    Helper function used to create `fabric.Connection` to the remote machine.
+
+    If ssh-agent has identities, the first one is passed to paramiko
+    explicitly, so that the authentication is done with this key without
+    listing agent identities first. Other agent identities and keys
+    are still tried by paramiko if the authentication fails.
+
+    Attributes:
+        username:
+            Username on the remote machine to connect through.
+        host:
+            IP address of the remote machine to connect.
+    """
+    connect_kwargs = {}
+    key = get_agent_key()
+
+    if key is not None:
+        connect_kwargs['pkey'] = key
+
+    return fabric.Connection(
+        host=host,
+        user=username,
+        connect_timeout=SSH_CONNECTION_TIMEOUT,
+        connect_kwargs=connect_kwargs
+    )
+
+
+def get_connection(username: str, host: str):
+    """
+    Helper function used to get `fabric.Connection` to the remote machine
+    from the pool of connections.
+
+    The connection is created and opened on the first request for a
+    particular (username, host) pair, and reopened if its transport is no
+    longer active, e.g. because the connection has been dropped. The
+    connections are not closed by the callers, they are closed by
+    `release_all` once the experiment is over or at exit. Access to the
+    pool is guarded by a lock, so the function can be called from several
+    threads. The connections to different machines are opened in parallel.
+
+    Attributes:
+        username:
+            Username on the remote machine to connect through.
+        host:
+            IP address of the remote machine to connect.
+
+    Raises:
+        paramiko.ssh_exception.SSHException, TimeoutError
+    """
+    key = (username, host)
+
+    with _CONNECTIONS_LOCK:
+        c = _CONNECTIONS.get(key)
+
+        if c is None:
+            c = create_connection(username, host)
+            _CONNECTIONS[key] = c
+            _CONNECTION_LOCKS[key] = threading.Lock()
+
+        lock = _CONNECTION_LOCKS[key]
+
+    with lock:
+        # The transport of a connection which is in use by another thread
+        # is active, so the connection is never reopened under its feet
+        if not c.is_connected:
+            logger.debug(
+                'Opening connection to the remote machine: %s@%s',
+                username, host
+            )
+            c.open()
+            c.transport.set_keepalive(SSH_POOL_KEEPALIVE_INTERVAL)
+
+    return c
+
+
+@atexit.register
+def release_all():
+    """
+    Helper function used to close all the connections from the pool.
+    """
+    with _CONNECTIONS_LOCK:
+        for c in _CONNECTIONS.values():
+            c.close()
+        _CONNECTIONS.clear()
+        _CONNECTION_LOCKS.clear()
@@ -1,6 +1,12 @@
 """ Unit tests for object_runners.py module """
+import pathlib
+import shlex
+from unittest import mock
+
 import pytest
 
+from srt_utils import object_runners
+from srt_utils.enums import Status
 from srt_utils.objects import SrtXtransmit, Tshark
 from srt_utils.object_runners import LocalRunner, RemoteRunner
 from srt_utils.runners import SimpleFactory
@@ -49,4 +55,214 @@ def test_factory_creates_right_runner(runner_type, runner_config, classname):
     factory = SimpleFactory()
     obj = factory.create_object('tshark', TSHARK_CONFIG)
     runner = factory.create_runner(obj, runner_type, runner_config)
-    assert isinstance(runner, classname)
\ No newline at end of file
+    assert isinstance(runner, classname)
+
+
+def test_remote_runner_quotes_command_args():
+    obj = SrtXtransmit(
+        'snd',
+        '../srt-xtransmit/_build/bin/srt-xtransmit',
+        '4200',
+        '127.0.0.1',
+        [('streamid', 'a"b$c')],
+        [('--msgsize', '1316')]
+    )
+    runner = RemoteRunner(obj, 'msharabayko', '137.116.228.51')
+    assert shlex.split(runner.args[-1]) == obj.make_args()
+
+
+def test_remote_runner_start(monkeypatch, tmp_path):
+    control_dir = tmp_path / 'control'
+    monkeypatch.setattr(object_runners, 'SSH_CONTROL_DIR', control_dir)
+    monkeypatch.setattr(object_runners, '_SSH_DESTINATIONS', set())
+
+    factory = SimpleFactory()
+    obj = factory.create_object('srt-xtransmit', SRT_XTRANSMIT_CONFIG)
+    runner = RemoteRunner(obj, 'msharabayko', '137.116.228.51')
+    runner.process = mock.Mock(spec=object_runners.Process, stdout_path=None)
+    runner.start()
+
+    runner.process.start.assert_called_once_with()
+    assert control_dir.is_dir()
+    assert object_runners._SSH_DESTINATIONS == {'msharabayko@137.116.228.51'}
+
+
+@pytest.mark.parametrize('transport, via_tar', [
+    ('auto', True),
+    ('scp', False),
+    ('rsync', False),
+    ('sftp', False),
+])
+def test_remote_runner_collect_results_bulk_transport(monkeypatch, transport, via_tar):
+    collect_results = mock.Mock()
+    collect_results_via_tar = mock.Mock()
+    monkeypatch.setattr(RemoteRunner, 'collect_results', collect_results)
+    monkeypatch.setattr(
+        RemoteRunner,
+        '_collect_results_via_tar',
+        collect_results_via_tar
+    )
+
+    runners = []
+    for i in range(2):
+        config = dict(
+            SRT_XTRANSMIT_CONFIG,
+            options_values={'--statsfile': f'_results/stats-{i}.csv'}
+        )
+        obj = SimpleFactory().create_object('srt-xtransmit', config)
+        runners.append(
+            RemoteRunner(obj, 'msharabayko', '137.116.228.51', transport=transport)
+        )
+
+    RemoteRunner.collect_results_bulk(runners)
+
+    assert collect_results_via_tar.called == via_tar
+    assert collect_results.call_count == (0 if via_tar else 2)
+
+
+@pytest.mark.parametrize('exited, stdout, sizes', [
+    (0, '10\n-\n', {'a.csv': 10, 'b.csv': None}),
+    (0, '10\n', {}),
+    (1, '', {}),
+    (0, '10\nbogus\n', {'a.csv': 10}),
+])
+def test_remote_runner_get_file_sizes(exited, stdout, sizes):
+    c = mock.Mock()
+    c.run.return_value = mock.Mock(exited=exited, stdout=stdout, stderr='')
+    filepaths = [pathlib.Path('a.csv'), pathlib.Path('b.csv')]
+    result = RemoteRunner._get_file_sizes(c, filepaths)
+    assert result == {pathlib.Path(k): v for k, v in sizes.items()}
+
+
+def test_forget_created_directories(tmp_path):
+    dirpath = tmp_path / 'results'
+    object_runners.ensure_local_directory(dirpath)
+    dirpath.rmdir()
+
+    object_runners.forget_created_directories()
+    object_runners.ensure_local_directory(dirpath)
+    assert dirpath.is_dir()
+
+
+def test_start_many_starts_all_runners():
+    runners = [mock.Mock() for _ in range(3)]
+    LocalRunner.start_many(runners)
+    for runner in runners:
+        runner.start.assert_called_once_with()
+
+
+def test_run_in_parallel_calls_all_runners_before_raising():
+    runners = [mock.Mock() for _ in range(10)]
+    runners[0].stop.side_effect = object_runners.SrtUtilsException('failed')
+
+    with pytest.raises(object_runners.SrtUtilsException):
+        object_runners.run_in_parallel(runners, 'stop', max_workers=2)
+
+    for runner in runners:
+        runner.stop.assert_called_once_with()
+
+
+def test_run_in_parallel_returns_results_in_order():
+    runners = [mock.Mock(**{'start.return_value': i}) for i in range(5)]
+    assert object_runners.run_in_parallel(runners, 'start') == list(range(5))
+
+
+@pytest.mark.parametrize('source, via_scp', [
+    ('_results/stats.csv', True),
+    ('_results/my stats.csv', False),
+    ("_results/it's.csv", False),
+])
+def test_remote_runner_get_file_scp_paths(monkeypatch, tmp_path, source, via_scp):
+    run = mock.Mock()
+    monkeypatch.setattr(object_runners.subprocess, 'run', run)
+    monkeypatch.setattr(object_runners.shutil, 'which', lambda _: '/usr/bin/scp')
+    monkeypatch.setattr(object_runners, 'SSH_CONTROL_DIR', tmp_path)
+    monkeypatch.setattr(object_runners, '_SSH_DESTINATIONS', set())
+
+    obj = SimpleFactory().create_object('srt-xtransmit', SRT_XTRANSMIT_CONFIG)
+    runner = RemoteRunner(obj, 'msharabayko', '137.116.228.51', transport='scp')
+    c = mock.Mock()
+    runner._get_file(c, pathlib.Path(source), tmp_path / 'stats.csv', None)
+
+    assert run.called == via_scp
+    assert c.get.called != via_scp
+    if via_scp:
+        assert run.call_args[0][0][-2] == f'msharabayko@137.116.228.51:{source}'
+
+
+@pytest.mark.parametrize('status, sends_sigint', [
+    (Status.running, True),
+    (Status.idle, False),
+])
+def test_remote_runner_send_sigint(monkeypatch, status, sends_sigint):
+    c = mock.Mock()
+    c.run.return_value = mock.Mock(exited=0)
+    monkeypatch.setattr(object_runners, 'get_connection', lambda *_: c)
+
+    obj = SimpleFactory().create_object('srt-xtransmit', SRT_XTRANSMIT_CONFIG)
+    runner = RemoteRunner(obj, 'msharabayko', '137.116.228.51', use_pty=False)
+    runner.process = mock.Mock(
+        is_started=True,
+        is_stopped=False,
+        status=(status, None)
+    )
+    runner._send_sigint()
+
+    command = c.run.call_args[0][0]
+    assert ('kill -INT' in command) == sends_sigint
+    assert f'rm -f {runner.pidfile}' in command
+
+
+def make_finished_runner(artifacts):
+    runner = mock.Mock()
+    runner.obj.artifacts = artifacts
+    runner.process = mock.Mock(is_started=True, is_stopped=True)
+    return runner
+
+
+# A lot of missing files make tar write more errors than the pipe can hold
+@pytest.mark.parametrize('missing_count', [1, 1200])
+def test_remote_runner_collect_results_via_tar(monkeypatch, tmp_path, missing_count):
+    # Remote tar is run by a local shell instead of ssh
+    monkeypatch.setattr(object_runners, 'get_ssh_args', lambda *_, **__: ('sh', '-c'))
+    monkeypatch.setattr(object_runners, 'SSH_CONTROL_DIR', tmp_path / 'control')
+    monkeypatch.setattr(object_runners, '_SSH_DESTINATIONS', set())
+    log_missing_artifact = mock.Mock()
+    monkeypatch.setattr(object_runners, 'log_missing_artifact', log_missing_artifact)
+
+    remote_dir = tmp_path / 'remote'
+    (remote_dir / 'a').mkdir(parents=True)
+    (remote_dir / 'b').mkdir(parents=True)
+    (remote_dir / 'a' / 'stats.csv').write_bytes(b'a' * 100000)
+    (remote_dir / 'b' / 'stats.csv').write_bytes(b'b')
+    (remote_dir / 'a' / 'trace.pcapng').write_bytes(b'trace')
+    missing = [
+        remote_dir / 'a' / f'missing-{i}.csv'
+        for i in range(missing_count)
+    ]
+
+    runner_a = make_finished_runner([
+        remote_dir / 'a' / 'stats.csv',
+        remote_dir / 'a' / 'trace.pcapng',
+        *missing,
+    ])
+    # The file with the same name produced by another object is not saved
+    runner_b = make_finished_runner([remote_dir / 'b' / 'stats.csv'])
+
+    results_dir = tmp_path / 'results'
+    results_dir.mkdir()
+    RemoteRunner._collect_results_via_tar(
+        'msharabayko',
+        '137.116.228.51',
+        results_dir,
+        [runner_a, runner_b]
+    )
+
+    destination_dir = results_dir / 'msharabayko@137.116.228.51'
+    assert (destination_dir / 'stats.csv').read_bytes() == b'a' * 100000
+    assert (destination_dir / 'trace.pcapng').read_bytes() == b'trace'
+    assert sorted(p.name for p in destination_dir.iterdir()) == [
+        'stats.csv',
+        'trace.pcapng',
+    ]
+    assert [c[0][2] for c in log_missing_artifact.call_args_list] == missing
@@ -1,6 +1,7 @@
 """ Unit tests for objects.py module """
 import pytest
 
+from srt_utils.exceptions import SrtUtilsException
 from srt_utils.runners import SimpleFactory
 
 
@@ -10,7 +11,7 @@ CONFIG_0 = {
     'port': '4200'
 }
 ARGS_0 = ['../srt-xtransmit/_build/bin/srt-xtransmit', 'receive', 'srt://:4200']
-ARGSSTR_0 = '../srt-xtransmit/_build/bin/srt-xtransmit receive "srt://:4200"'
+ARGSSTR_0 = '../srt-xtransmit/_build/bin/srt-xtransmit receive srt://:4200'
 
 
 CONFIG_1 = {
@@ -34,7 +35,7 @@ ARGS_2 = [
     '../srt-xtransmit/_build/bin/srt-xtransmit', 'receive', 'srt://:4200',
     '--statsfile', '_results/srt-xtransmit-stats-rcv.csv', '--statsfreq', '100'
 ]
-ARGSSTR_2 = '../srt-xtransmit/_build/bin/srt-xtransmit receive "srt://:4200" ' \
+ARGSSTR_2 = '../srt-xtransmit/_build/bin/srt-xtransmit receive srt://:4200 ' \
     '--statsfile _results/srt-xtransmit-stats-rcv.csv --statsfreq 100'
 
 
@@ -45,7 +46,7 @@ CONFIG_3 = {
     'host': '127.0.0.1'
 }
 ARGS_3 = ['../srt-xtransmit/_build/bin/srt-xtransmit', 'generate', 'srt://127.0.0.1:4200']
-ARGSSTR_3 = '../srt-xtransmit/_build/bin/srt-xtransmit generate "srt://127.0.0.1:4200"'
+ARGSSTR_3 = '../srt-xtransmit/_build/bin/srt-xtransmit generate srt://127.0.0.1:4200'
 
 
 CONFIG_4 = {
@@ -64,7 +65,7 @@ ARGS_4 = [
     'srt://127.0.0.1:4200?transtype=live&rcvbuf=1000000000&sndbuf=1000000000'
 ]
 ARGSSTR_4 = '../srt-xtransmit/_build/bin/srt-xtransmit generate ' \
-    '"srt://127.0.0.1:4200?transtype=live&rcvbuf=1000000000&sndbuf=1000000000"'
+    "'srt://127.0.0.1:4200?transtype=live&rcvbuf=1000000000&sndbuf=1000000000'"
 
 
 CONFIG_5 = {
@@ -84,7 +85,7 @@ ARGS_5 = [
     '--duration', '10s'
 ]
 ARGSSTR_5 = '../srt-xtransmit/_build/bin/srt-xtransmit generate ' \
-    '"srt://127.0.0.1:4200" --msgsize 1316 --sendrate 15Mbps --duration 10s'
+    'srt://127.0.0.1:4200 --msgsize 1316 --sendrate 15Mbps --duration 10s'
 
 CONFIG_6 = {
     'type': 'rcv',
@@ -98,7 +99,7 @@ ARGS_6 = [
     '../srt-xtransmit/_build/bin/srt-xtransmit', 'receive', 'srt://:4200',
     '--statsfile', '_results/prefix-srt-xtransmit-stats-rcv.csv', '--statsfreq', '100'
 ]
-ARGSSTR_6 = '../srt-xtransmit/_build/bin/srt-xtransmit receive "srt://:4200" ' \
+ARGSSTR_6 = '../srt-xtransmit/_build/bin/srt-xtransmit receive srt://:4200 ' \
     '--statsfile _results/prefix-srt-xtransmit-stats-rcv.csv --statsfreq 100'
 
 CONFIG_7 = {
@@ -108,7 +109,7 @@ CONFIG_7 = {
     'dirpath': '_results'
 }
 ARGS_7 = ['tshark', '-i', 'en0', '-f', 'udp port 4200', '-s', '1500', '-w', '_results/tshark-tracefile.pcapng']
-ARGSSTR_7 = 'tshark -i en0 -f "udp port 4200" -s 1500 -w _results/tshark-tracefile.pcapng'
+ARGSSTR_7 = "tshark -i en0 -f 'udp port 4200' -s 1500 -w _results/tshark-tracefile.pcapng"
 
 CONFIG_8 = {
     'path': 'tshark',
@@ -118,7 +119,7 @@ CONFIG_8 = {
     'prefix': 'prefix'
 }
 ARGS_8 = ['tshark', '-i', 'en0', '-f', 'udp port 4200', '-s', '1500', '-w', '_results/prefix-tshark-tracefile.pcapng']
-ARGSSTR_8 = 'tshark -i en0 -f "udp port 4200" -s 1500 -w _results/prefix-tshark-tracefile.pcapng'
+ARGSSTR_8 = "tshark -i en0 -f 'udp port 4200' -s 1500 -w _results/prefix-tshark-tracefile.pcapng"
 
 
 
@@ -159,4 +160,11 @@ def test_make_args(type, config, args):
 def test_make_str(type, config, args_str):
     factory = SimpleFactory()
     obj = factory.create_object(type, config)
-    assert args_str == obj.make_str()
\ No newline at end of file
+    assert args_str == obj.make_str()
+
+
+def test_unknown_xtransmit_type():
+    factory = SimpleFactory()
+    config = dict(CONFIG_0, type='unknown')
+    with pytest.raises(SrtUtilsException):
+        factory.create_object('srt-xtransmit', config)
@@ -0,0 +1,53 @@
+""" Unit tests for ssh_pool.py module """
+import threading
+from unittest import mock
+
+from srt_utils import ssh_pool
+
+
+def make_connection(open_side_effect=None):
+    c = mock.Mock(is_connected=False)
+
+    def open():
+        if open_side_effect is not None:
+            open_side_effect()
+        c.is_connected = True
+
+    c.open.side_effect = open
+    return c
+
+
+def test_unreachable_host_does_not_block_other_hosts(monkeypatch):
+    opening = threading.Event()
+    unblock = threading.Event()
+
+    def slow_open():
+        opening.set()
+        unblock.wait(5)
+
+    connections = {
+        'slow': make_connection(slow_open),
+        'fast': make_connection(),
+    }
+    monkeypatch.setattr(
+        ssh_pool,
+        'create_connection',
+        lambda username, host: connections[host]
+    )
+    monkeypatch.setattr(ssh_pool, '_CONNECTIONS', {})
+    monkeypatch.setattr(ssh_pool, '_CONNECTION_LOCKS', {})
+
+    thread = threading.Thread(target=ssh_pool.get_connection, args=('user', 'slow'))
+    thread.start()
+    assert opening.wait(5)
+
+    try:
+        assert ssh_pool.get_connection('user', 'fast') is connections['fast']
+        assert connections['slow'].is_connected is False
+    finally:
+        unblock.set()
+        thread.join()
+
+    assert connections['slow'].is_connected is True
+    assert ssh_pool.get_connection('user', 'slow') is connections['slow']
+    connections['slow'].open.assert_called_once_with()